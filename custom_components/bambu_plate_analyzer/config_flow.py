@@ -10,7 +10,7 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.helpers import entity_registry as er
 
-from .const import CONF_SERIAL, DOMAIN
+from .const import BAMBU_LAB_DOMAIN, CONF_SERIAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,16 +35,14 @@ class BambuPlateAnalyzerConfigFlow(ConfigFlow, domain=DOMAIN):
 
             # Validate: look for the printable_objects entity in the registry
             ent_reg = er.async_get(self.hass)
-            printable_entry = None
-            pick_image_entry = None
-
-            for entry in ent_reg.entities.values():
-                if entry.unique_id == f"{serial}_printable_objects":
-                    printable_entry = entry
-                elif entry.unique_id == f"{serial}_pick_image":
-                    pick_image_entry = entry
-
-            if printable_entry is None or pick_image_entry is None:
+            printable_entity_id = ent_reg.async_get_entity_id(
+                "sensor", BAMBU_LAB_DOMAIN, f"{serial}_printable_objects"
+            )
+            pick_image_entity_id = ent_reg.async_get_entity_id(
+                "image", BAMBU_LAB_DOMAIN, f"{serial}_pick_image"
+            )
+
+            if printable_entity_id is None or pick_image_entity_id is None:
                 errors["base"] = "entities_not_found"
             else:
                 return self.async_create_entry(
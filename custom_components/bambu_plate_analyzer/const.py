@@ -4,4 +4,7 @@ DOMAIN = "bambu_plate_analyzer"
 
 CONF_SERIAL = "serial"
 
+# Domain of the ha-bambulab integration providing the source entities
+BAMBU_LAB_DOMAIN = "bambu_lab"
+
 PLATFORMS = ["sensor", "image"]
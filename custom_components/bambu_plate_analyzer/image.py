@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
@@ -30,6 +32,8 @@ class BambuPlateAnalyzerImage(ImageEntity):
     _attr_translation_key = "plate_image"
     _attr_content_type = "image/jpeg"
 
+    __slots__ = ("_serial", "_entry_data", "_last_updated")
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -39,7 +43,7 @@ class BambuPlateAnalyzerImage(ImageEntity):
         """Initialize the image entity."""
         super().__init__(hass)
         self._serial = serial
-        self._entry = entry
+        self._entry_data: dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
         self._attr_unique_id = f"{serial}_plate_analyzer_image"
         self._last_updated: datetime | None = None
 
@@ -50,23 +54,15 @@ class BambuPlateAnalyzerImage(ImageEntity):
 
     async def async_image(self) -> bytes | None:
         """Return JPEG bytes from hass.data store."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        return entry_data.get("jpeg_bytes")
+        return self._entry_data.get("jpeg_bytes")
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to sensor state changes to know when image updates."""
         # Find the plate_analyzer sensor entity_id for this entry
-        sensor_entity_id = None
-        for state in self.hass.states.async_all("sensor"):
-            if state.entity_id.endswith("_plate_analyzer"):
-                # Verify it belongs to our serial by checking unique_id via registry
-                from homeassistant.helpers import entity_registry as er
-
-                ent_reg = er.async_get(self.hass)
-                entry = ent_reg.async_get(state.entity_id)
-                if entry and entry.unique_id == f"{self._serial}_plate_analyzer":
-                    sensor_entity_id = state.entity_id
-                    break
+        ent_reg = er.async_get(self.hass)
+        sensor_entity_id = ent_reg.async_get_entity_id(
+            "sensor", DOMAIN, f"{self._serial}_plate_analyzer"
+        )
 
         if sensor_entity_id:
             self.async_on_remove(
@@ -87,8 +83,7 @@ class BambuPlateAnalyzerImage(ImageEntity):
     @callback
     def _check_jpeg_update(self) -> None:
         """Check if JPEG data was updated and refresh image_last_updated."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        updated = entry_data.get("jpeg_updated")
+        updated = self._entry_data.get("jpeg_updated")
         if updated and updated != self._last_updated:
             self._last_updated = updated
             self.async_write_ha_state()
@@ -2,92 +2,419 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 from io import BytesIO
 from typing import Any
 
+import numpy as np
 from PIL import Image
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import CONF_SERIAL, DOMAIN
+from .const import BAMBU_LAB_DOMAIN, CONF_SERIAL, DOMAIN
+
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; fall back to Pillow
+    cv2 = None
+
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to the NumPy reduction
+    numba = None
+
+try:
+    from scipy import ndimage
+except ImportError:  # SciPy is optional; fall back to the NumPy reduction
+    ndimage = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of recently analyzed pick images kept in memory
+ANALYSIS_CACHE_SIZE = 2
+
+# Seconds to coalesce bursts of printable_objects state changes
+PROCESS_COOLDOWN = 0.5
+
+
+def _reduce_bboxes_numpy(
+    ids: np.ndarray, mask: np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce per-id bounding boxes with NumPy grouped min/max.
 
-def compute_bounding_boxes(image_bytes: bytes) -> dict[str, Any]:
-    """Compute bounding boxes for each object in the pick image.
+    ``mask`` selects opaque pixels; None means every pixel is opaque.
+
+    Returns (unique ids, N×4 array of [min_x, min_y, max_x, max_y]).
+    """
+    image_height, image_width = ids.shape
+
+    # Group opaque pixels by identify_id and reduce all extents in one sweep
+    if mask is None:
+        ys, xs = np.divmod(np.arange(ids.size), image_width)
+        uniq, inv = np.unique(ids.ravel(), return_inverse=True)
+    else:
+        ys, xs = np.nonzero(mask)
+        uniq, inv = np.unique(ids[mask], return_inverse=True)
+    boxes = np.empty((len(uniq), 4), np.int32)
+    boxes[:, 0] = image_width
+    boxes[:, 1] = image_height
+    boxes[:, 2:] = -1
+    np.minimum.at(boxes[:, 0], inv, xs)
+    np.minimum.at(boxes[:, 1], inv, ys)
+    np.maximum.at(boxes[:, 2], inv, xs)
+    np.maximum.at(boxes[:, 3], inv, ys)
+    return uniq, boxes
+
+
+def _reduce_bboxes_scipy(
+    ids: np.ndarray, mask: np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce per-id bounding boxes with scipy.ndimage.find_objects.
+
+    ``mask`` selects opaque pixels; None means every pixel is opaque.
+
+    Returns (unique ids, N×4 array of [min_x, min_y, max_x, max_y]).
+    """
+    # Relabel ids as 1..N so find_objects can slice them in one C pass;
+    # transparent pixels stay 0 (background)
+    if mask is None:
+        uniq, inv = np.unique(ids.ravel(), return_inverse=True)
+    else:
+        uniq, inv = np.unique(ids[mask], return_inverse=True)
+    # Use the narrowest label type; inv itself is intp (8 bytes per pixel)
+    dtype = np.uint16 if len(uniq) < 65535 else np.uint32
+    if mask is None:
+        labels = inv.reshape(ids.shape).astype(dtype)
+        labels += 1
+    else:
+        labels = np.zeros(ids.shape, dtype)
+        labels[mask] = inv + 1
+    del inv
+
+    slices = ndimage.find_objects(labels, max_label=len(uniq))
+    boxes = np.array(
+        [[xs.start, ys.start, xs.stop - 1, ys.stop - 1] for ys, xs in slices],
+        np.int32,
+    ).reshape(-1, 4)
+    return uniq, boxes
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _bbox_kernel(
+        ids: np.ndarray, mask: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Reduce per-id bounding boxes in a single compiled pass.
+
+        Returns (ids in first-seen order, N×4 array of
+        [min_x, min_y, max_x, max_y]).
+        """
+        image_height, image_width = ids.shape
+        slots = numba.typed.Dict.empty(numba.types.uint32, numba.types.int64)
+        keys = np.empty(64, np.uint32)
+        boxes = np.empty((64, 4), np.int32)
+        count = 0
+        last_key = np.uint32(0)
+        slot = -1
+
+        for y in range(image_height):
+            for x in range(image_width):
+                if mask is not None and not mask[y, x]:
+                    continue
+                key = ids[y, x]
+                # Objects are solid runs of one color, so the previous
+                # pixel's slot is usually the right one
+                if slot < 0 or key != last_key:
+                    last_key = key
+                    if key in slots:
+                        slot = slots[key]
+                    else:
+                        if count == len(keys):
+                            keys = np.concatenate((keys, np.empty_like(keys)))
+                            boxes = np.concatenate((boxes, np.empty_like(boxes)))
+                        slot = count
+                        slots[key] = slot
+                        keys[slot] = key
+                        boxes[slot, 0] = x
+                        boxes[slot, 1] = y
+                        boxes[slot, 2] = x
+                        boxes[slot, 3] = y
+                        count += 1
+                        continue
+                box = boxes[slot]
+                if x < box[0]:
+                    box[0] = x
+                if x > box[2]:
+                    box[2] = x
+                # Rows are scanned top to bottom, so min_y is already set
+                box[3] = y
+
+        return keys[:count], boxes[:count]
+
+else:
+    _bbox_kernel = None
+
+
+# Whether the Numba kernel warm-up has been scheduled in this process
+_bbox_kernel_warm_up_scheduled = False
+
+
+def warm_up_bbox_kernel() -> None:
+    """Compile the Numba bbox kernel so the first analysis isn't penalized.
+
+    If compilation fails, the kernel is disabled and the SciPy/NumPy
+    reductions are used instead.
+    """
+    global _bbox_kernel
+
+    mask = np.ones((1, 1), np.bool_)
+    try:
+        for dtype in (np.uint32, np.uint8):
+            ids = np.zeros((1, 1), dtype)
+            # Palette indices from Pillow are read-only, which Numba
+            # compiles as a separate specialization
+            readonly_ids = ids.copy()
+            readonly_ids.setflags(write=False)
+            for kernel_ids in (ids, readonly_ids):
+                _bbox_kernel(kernel_ids, mask)
+                _bbox_kernel(kernel_ids, None)
+    except Exception:
+        _LOGGER.warning(
+            "Failed to compile Numba bbox kernel, falling back", exc_info=True
+        )
+        _bbox_kernel = None
+
+
+def _reduce_bboxes(
+    ids: np.ndarray, mask: np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce per-id bounding boxes with the fastest available backend."""
+    if _bbox_kernel is not None:
+        return _bbox_kernel(ids, mask)
+    if ndimage is not None:
+        return _reduce_bboxes_scipy(ids, mask)
+    return _reduce_bboxes_numpy(ids, mask)
+
+
+def _bboxes_to_dict(
+    uniq: np.ndarray, boxes: np.ndarray
+) -> dict[str, list[int]]:
+    """Map identify_ids to bounding boxes, merging repeated ids."""
+    bboxes: dict[str, list[int]] = {}
+    for uid, box in zip(uniq.tolist(), boxes.tolist()):
+        identify_id = str(uid)
+        if (bbox := bboxes.get(identify_id)) is None:
+            bboxes[identify_id] = box
+        else:
+            bbox[0] = min(bbox[0], box[0])
+            bbox[1] = min(bbox[1], box[1])
+            bbox[2] = max(bbox[2], box[2])
+            bbox[3] = max(bbox[3], box[3])
+    return bboxes
+
+
+def compute_bounding_boxes(
+    arr: np.ndarray, bgra: bool = False
+) -> dict[str, list[int]]:
+    """Compute bounding boxes for each object in a pick image array.
+
+    ``arr`` is an H×W×4 (RGBA) or H×W×3 (RGB) uint8 array, in BGRA/BGR
+    order when ``bgra`` is set (as decoded by OpenCV). Images without an
+    alpha channel are treated as fully opaque.
 
     Replicates ha-bambulab's color→identify_id conversion (BGR ordering)
     and additionally tracks min/max x/y per object.
 
-    Returns dict with image_width, image_height, and objects mapping.
+    Returns mapping of identify_id → [min_x, min_y, max_x, max_y].
     """
-    image = Image.open(BytesIO(image_bytes))
-    image_width, image_height = image.size
-    pixels = image.load()
+    if arr.shape[2] == 4:
+        # Reinterpret each pixel as one little-endian uint32:
+        # A<<24 | B<<16 | G<<8 | R for RGBA (A<<24 | R<<16 | G<<8 | B for BGRA)
+        packed = np.ascontiguousarray(arr).view("<u4")[..., 0]
+        ids = packed & 0x00FFFFFF
+        # Skip transparent pixels (alpha byte is zero)
+        mask = packed > 0x00FFFFFF
+        swap_ids = bgra
+    else:
+        blue, red = (0, 2) if bgra else (2, 0)
+        # BGR ordering, same as ha-bambulab
+        ids = (
+            (arr[..., blue].astype(np.uint32) << 16)
+            | (arr[..., 1].astype(np.uint32) << 8)
+            | arr[..., red]
+        )
+        mask = None
+        swap_ids = False
 
-    # Track bounding boxes: identify_id → [min_x, min_y, max_x, max_y]
-    bboxes: dict[str, list[int]] = {}
-    seen_colors: dict[tuple, str] = {}
-
-    for y in range(image_height):
-        for x in range(image_width):
-            current_color = pixels[x, y]
-            r, g, b, a = current_color
-
-            # Skip transparent pixels
-            if a == 0:
-                continue
-
-            # Check if we already mapped this color
-            if current_color in seen_colors:
-                identify_id = seen_colors[current_color]
-            else:
-                # BGR ordering, same as ha-bambulab
-                identify_id = str(int(f"0x{b:02X}{g:02X}{r:02X}", 16))
-                seen_colors[current_color] = identify_id
-
-            # Update bounding box
-            if identify_id in bboxes:
-                bbox = bboxes[identify_id]
-                if x < bbox[0]:
-                    bbox[0] = x
-                if y < bbox[1]:
-                    bbox[1] = y
-                if x > bbox[2]:
-                    bbox[2] = x
-                if y > bbox[3]:
-                    bbox[3] = y
-            else:
-                bboxes[identify_id] = [x, y, x, y]
-
-    return {
+    uniq, boxes = _reduce_bboxes(ids, mask)
+
+    if swap_ids:
+        # Packed BGRA gives RGB-ordered ids; swap to ha-bambulab's BGR order
+        uniq = ((uniq & 0xFF) << 16) | (uniq & 0xFF00) | (uniq >> 16)
+
+    return _bboxes_to_dict(uniq, boxes)
+
+
+def compute_palette_bounding_boxes(
+    indices: np.ndarray, palette: np.ndarray
+) -> dict[str, list[int]]:
+    """Compute bounding boxes for a palette-mode pick image.
+
+    ``indices`` is the H×W uint8 palette index array and ``palette`` the
+    256×4 RGBA palette. The reduction runs on the 8-bit indices; only the
+    palette entries are converted to identify_ids.
+
+    Returns mapping of identify_id → [min_x, min_y, max_x, max_y].
+    """
+    # Skip pixels whose palette entry is transparent
+    opaque = palette[:, 3] != 0
+    mask = None if opaque.all() else opaque[indices]
+
+    uniq, boxes = _reduce_bboxes(indices, mask)
+
+    # BGR ordering, same as ha-bambulab
+    colors = palette.astype(np.uint32)
+    palette_ids = (colors[:, 2] << 16) | (colors[:, 1] << 8) | colors[:, 0]
+    return _bboxes_to_dict(palette_ids[uniq], boxes)
+
+
+def _palette_rgba(image: Image.Image) -> np.ndarray:
+    """Return the palette of a P-mode image as a 256×4 RGBA array."""
+    palette = np.zeros((256, 4), np.uint8)
+    palette[:, 3] = 255
+    entries = np.asarray(image.getpalette("RGBA"), np.uint8).reshape(-1, 4)
+    palette[: len(entries)] = entries
+
+    # PNG tRNS: per-entry alpha bytes, or a single transparent index
+    transparency = image.info.get("transparency")
+    if isinstance(transparency, bytes):
+        palette[: len(transparency), 3] = np.frombuffer(transparency, np.uint8)
+    elif isinstance(transparency, int):
+        palette[transparency, 3] = 0
+    return palette
+
+
+def _is_palette_png(image_bytes: bytes) -> bool:
+    """Return whether the bytes are an indexed-color PNG (IHDR color type 3)."""
+    return image_bytes[:8] == b"\x89PNG\r\n\x1a\n" and image_bytes[25:26] == b"\x03"
+
+
+def _drop_alpha(arr: np.ndarray) -> np.ndarray:
+    """Return the color channels of an image array, blacking out transparency.
+
+    JPEG doesn't support alpha. The pick image uses alpha as an object
+    mask rather than real translucency, so zeroing transparent pixels is
+    equivalent to compositing onto a black background.
+    """
+    if arr.shape[-1] != 4:
+        return arr
+    color = arr[..., :3].copy()
+    color[arr[..., 3] == 0] = 0
+    return color
+
+
+def convert_to_jpeg(arr: np.ndarray, quality: int = 80) -> bytes:
+    """Encode an RGBA or RGB image array as JPEG with Pillow."""
+    buf = BytesIO()
+    Image.fromarray(_drop_alpha(arr)).save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def _decode_cv2(image_bytes: bytes) -> np.ndarray | None:
+    """Decode image bytes to an H×W×4 BGRA or H×W×3 BGR array with OpenCV.
+
+    Returns None if OpenCV cannot produce an 8-bit image.
+    """
+    arr = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_UNCHANGED)
+    if arr is None or arr.dtype != np.uint8:
+        return None
+    if arr.ndim == 2:
+        return cv2.cvtColor(arr, cv2.COLOR_GRAY2BGR)
+    return arr
+
+
+def _encode_jpeg_cv2(arr: np.ndarray, quality: int) -> bytes:
+    """Encode a BGRA or BGR image array as JPEG with OpenCV."""
+    ok, buf = cv2.imencode(
+        ".jpg", _drop_alpha(arr), [cv2.IMWRITE_JPEG_QUALITY, quality]
+    )
+    if not ok:
+        raise ValueError("OpenCV failed to encode JPEG")
+    return buf.tobytes()
+
+
+def analyze_pick_image(
+    image_bytes: bytes, quality: int = 80
+) -> tuple[dict[str, Any], bytes]:
+    """Decode the pick image once, compute bounding boxes and encode as JPEG.
+
+    Returns a tuple of (dict with image_width, image_height and bboxes,
+    JPEG bytes).
+    """
+    # Palette PNGs are left to Pillow, which keeps the 8-bit indices
+    if cv2 is not None and not _is_palette_png(image_bytes):
+        arr = _decode_cv2(image_bytes)
+        if arr is not None:
+            image_height, image_width = arr.shape[:2]
+            result = {
+                "image_width": image_width,
+                "image_height": image_height,
+                "bboxes": compute_bounding_boxes(arr, bgra=True),
+            }
+            return result, _encode_jpeg_cv2(arr, quality)
+
+    # The pick image is always a PNG; skip Pillow's format detection.
+    # Only the pixel array is kept, so the decoded image is closed early.
+    palette = None
+    with Image.open(BytesIO(image_bytes), formats=("PNG",)) as image:
+        image_width, image_height = image.size
+        if image.mode == "P":
+            palette = _palette_rgba(image)
+            arr = np.asarray(image)
+        elif image.mode in ("RGBA", "RGB"):
+            # RGBA and RGB are used as-is
+            arr = np.asarray(image)
+        else:
+            # Anything else is converted once
+            arr = np.asarray(image.convert("RGBA"))
+
+    if palette is not None:
+        result = {
+            "image_width": image_width,
+            "image_height": image_height,
+            "bboxes": compute_palette_bounding_boxes(arr, palette),
+        }
+        return result, convert_to_jpeg(_drop_alpha(palette)[arr], quality)
+
+    result = {
         "image_width": image_width,
         "image_height": image_height,
-        "bboxes": bboxes,
+        "bboxes": compute_bounding_boxes(arr),
     }
+    return result, convert_to_jpeg(arr, quality)
 
 
-def convert_to_jpeg(image_bytes: bytes, quality: int = 80) -> bytes:
-    """Convert image bytes to JPEG format."""
-    image = Image.open(BytesIO(image_bytes))
-    if image.mode == "RGBA":
-        # JPEG doesn't support alpha; composite onto black background
-        bg = Image.new("RGB", image.size, (0, 0, 0))
-        bg.paste(image, mask=image.split()[3])
-        image = bg
-    elif image.mode != "RGB":
-        image = image.convert("RGB")
-    buf = BytesIO()
-    image.save(buf, format="JPEG", quality=quality)
-    return buf.getvalue()
+def serialize_bbox_data(objects: dict[str, dict[str, Any]]) -> str:
+    """Serialize bbox data for ESPHome consumption.
+
+    Format: ID:name:min_x,min_y,max_x,max_y|...
+    """
+    return "|".join(
+        f"{identify_id}:{obj_data.get('name', '')}:"
+        + (",".join(map(str, obj_data["bbox"])) if obj_data.get("bbox") else "")
+        for identify_id, obj_data in objects.items()
+    )
 
 
 async def async_setup_entry(
@@ -96,7 +423,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor platform."""
+    global _bbox_kernel_warm_up_scheduled
+
     serial = entry.data[CONF_SERIAL]
+    if _bbox_kernel is not None and not _bbox_kernel_warm_up_scheduled:
+        _bbox_kernel_warm_up_scheduled = True
+        hass.async_add_executor_job(warm_up_bbox_kernel)
     async_add_entities([BambuPlateAnalyzerSensor(hass, entry, serial)])
 
 
@@ -107,6 +439,25 @@ class BambuPlateAnalyzerSensor(SensorEntity):
     _attr_translation_key = "plate_analyzer"
     _attr_icon = "mdi:cube-scan"
 
+    # Entity itself has no __slots__, so _attr_* and base class state still
+    # live in __dict__; this only covers attributes defined here
+    __slots__ = (
+        "_serial",
+        "_entry_data",
+        "_printable_objects_entity_id",
+        "_pick_image_entity_id",
+        "_unsub_registry_updated",
+        "_object_count",
+        "_objects",
+        "_bbox_data_str",
+        "_image_width",
+        "_image_height",
+        "_pending_state",
+        "_debouncer",
+        "_process_lock",
+        "_analysis_cache",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -115,7 +466,7 @@ class BambuPlateAnalyzerSensor(SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         self._serial = serial
-        self._entry = entry
+        self._entry_data: dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
         self._attr_unique_id = f"{serial}_plate_analyzer"
         self._attr_device_info = None
 
@@ -123,15 +474,33 @@ class BambuPlateAnalyzerSensor(SensorEntity):
         self._printable_objects_entity_id: str | None = None
         self._pick_image_entity_id: str | None = None
 
-        # Unsub for the global state_changed listener (startup race)
-        self._unsub_any_state: callback | None = None
+        # Unsub for the entity registry listener (startup race)
+        self._unsub_registry_updated: callback | None = None
 
         # State
         self._object_count: int = 0
         self._objects: dict[str, Any] = {}
+        self._bbox_data_str: str = ""
         self._image_width: int = 0
         self._image_height: int = 0
 
+        # Coalesce bursts of printable_objects updates into one analysis
+        self._pending_state: State | None = None
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PROCESS_COOLDOWN,
+            immediate=True,
+            function=self._async_process_pending_state,
+        )
+
+        # Recently analyzed pick images (hash → (result, JPEG bytes)), to
+        # skip decode and re-encode when the bytes are unchanged
+        self._process_lock = asyncio.Lock()
+        self._analysis_cache: OrderedDict[
+            bytes, tuple[dict[str, Any], bytes]
+        ] = OrderedDict()
+
     @property
     def native_value(self) -> int:
         """Return the number of detected objects."""
@@ -144,55 +513,38 @@ class BambuPlateAnalyzerSensor(SensorEntity):
             "image_width": self._image_width,
             "image_height": self._image_height,
             "objects": self._objects,
-            "bbox_data": self._bbox_data_serialized,
+            "bbox_data": self._bbox_data_str,
         }
 
-    @property
-    def _bbox_data_serialized(self) -> str:
-        """Serialize bbox data for ESPHome consumption.
-
-        Format: ID:name:min_x,min_y,max_x,max_y|...
-        """
-        if not self._objects:
-            return ""
-        parts = []
-        for identify_id, obj_data in self._objects.items():
-            name = obj_data.get("name", "")
-            bbox = obj_data.get("bbox")
-            if bbox:
-                parts.append(
-                    f"{identify_id}:{name}:{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}"
-                )
-            else:
-                parts.append(f"{identify_id}:{name}:")
-        return "|".join(parts)
-
     async def async_added_to_hass(self) -> None:
         """Resolve entity IDs and subscribe to changes."""
+        self.async_on_remove(self._debouncer.async_cancel)
+
         if not self._resolve_entities():
             _LOGGER.warning(
                 "Bambu Lab entities not found yet for serial %s, "
-                "will retry on state changes",
+                "will retry when they are registered",
                 self._serial,
             )
-            # Listen for any state change to retry resolution
-            self._unsub_any_state = self.hass.bus.async_listen(
-                "state_changed", self._on_any_state_changed
+            # Listen for entity registry additions to retry resolution
+            self._unsub_registry_updated = self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._on_registry_updated
             )
-            self.async_on_remove(self._cancel_any_state_listener)
+            self.async_on_remove(self._cancel_registry_listener)
             return
 
         self._subscribe_to_printable_objects()
 
     def _resolve_entities(self) -> bool:
-        """Look up entity IDs from the entity registry by unique_id suffix."""
+        """Look up ha-bambulab entity IDs from the entity registry by unique_id."""
         ent_reg = er.async_get(self.hass)
 
-        for entry in ent_reg.entities.values():
-            if entry.unique_id == f"{self._serial}_printable_objects":
-                self._printable_objects_entity_id = entry.entity_id
-            elif entry.unique_id == f"{self._serial}_pick_image":
-                self._pick_image_entity_id = entry.entity_id
+        self._printable_objects_entity_id = ent_reg.async_get_entity_id(
+            "sensor", BAMBU_LAB_DOMAIN, f"{self._serial}_printable_objects"
+        )
+        self._pick_image_entity_id = ent_reg.async_get_entity_id(
+            "image", BAMBU_LAB_DOMAIN, f"{self._serial}_pick_image"
+        )
 
         resolved = (
             self._printable_objects_entity_id is not None
@@ -224,21 +576,24 @@ class BambuPlateAnalyzerSensor(SensorEntity):
         # Process current state if available
         state = self.hass.states.get(self._printable_objects_entity_id)
         if state is not None and state.attributes.get("objects"):
-            self.hass.async_create_task(self._process_plate_data(state))
+            self._pending_state = state
+            self.hass.async_create_task(self._debouncer.async_call())
 
     @callback
-    def _cancel_any_state_listener(self) -> None:
-        """Cancel the global state change listener."""
-        if self._unsub_any_state is not None:
-            self._unsub_any_state()
-            self._unsub_any_state = None
+    def _cancel_registry_listener(self) -> None:
+        """Cancel the entity registry listener."""
+        if self._unsub_registry_updated is not None:
+            self._unsub_registry_updated()
+            self._unsub_registry_updated = None
 
     @callback
-    def _on_any_state_changed(self, event: Event) -> None:
-        """Retry entity resolution when any state changes (startup race)."""
+    def _on_registry_updated(self, event: Event) -> None:
+        """Retry entity resolution when an entity is registered (startup race)."""
+        if event.data["action"] != "create":
+            return
         if self._resolve_entities():
             _LOGGER.info("Bambu Lab entities resolved after startup delay")
-            self._cancel_any_state_listener()
+            self._cancel_registry_listener()
             self._subscribe_to_printable_objects()
 
     async def _on_printable_objects_changed(self, event: Event) -> None:
@@ -246,7 +601,16 @@ class BambuPlateAnalyzerSensor(SensorEntity):
         new_state = event.data.get("new_state")
         if new_state is None:
             return
-        await self._process_plate_data(new_state)
+        self._pending_state = new_state
+        await self._debouncer.async_call()
+
+    async def _async_process_pending_state(self) -> None:
+        """Process the latest printable_objects state (debouncer callback)."""
+        # The debouncer drops calls made while this job is running, so pick
+        # up any state that arrived during processing before returning
+        while (state := self._pending_state) is not None:
+            self._pending_state = None
+            await self._process_plate_data(state)
 
     async def _async_get_pick_image(self) -> bytes | None:
         """Get pick image bytes from the image entity via EntityComponent."""
@@ -271,6 +635,41 @@ class BambuPlateAnalyzerSensor(SensorEntity):
             )
             return None
 
+    async def _async_analyze_image(
+        self, image_bytes: bytes
+    ) -> dict[str, Any] | None:
+        """Compute bounding boxes and JPEG, reusing cached results for known images.
+
+        Must be called with ``self._process_lock`` held.
+        """
+        image_hash = hashlib.blake2b(image_bytes, digest_size=16).digest()
+        cached = self._analysis_cache.get(image_hash)
+        if cached is not None:
+            _LOGGER.debug("Pick image already analyzed, reusing cached result")
+            self._analysis_cache.move_to_end(image_hash)
+            result, jpeg_bytes = cached
+        else:
+            # Process in executor (Pillow is blocking)
+            try:
+                result, jpeg_bytes = await self.hass.async_add_executor_job(
+                    analyze_pick_image, image_bytes
+                )
+            except Exception:
+                _LOGGER.exception("Error processing pick image")
+                return None
+
+            self._analysis_cache[image_hash] = (result, jpeg_bytes)
+            while len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+        # Store the JPEG for the image entity, only bumping the timestamp
+        # when it actually changed
+        if self._entry_data.get("jpeg_bytes") is not jpeg_bytes:
+            self._entry_data["jpeg_bytes"] = jpeg_bytes
+            self._entry_data["jpeg_updated"] = datetime.now(timezone.utc)
+
+        return result
+
     async def _process_plate_data(self, printable_objects_state) -> None:
         """Fetch pick image, compute bounding boxes, update state."""
         objects_attr = printable_objects_state.attributes.get("objects", {})
@@ -278,6 +677,7 @@ class BambuPlateAnalyzerSensor(SensorEntity):
         if not objects_attr:
             self._object_count = 0
             self._objects = {}
+            self._bbox_data_str = ""
             self._image_width = 0
             self._image_height = 0
             self.async_write_ha_state()
@@ -290,13 +690,9 @@ class BambuPlateAnalyzerSensor(SensorEntity):
         if image_bytes is None:
             return
 
-        # Process in executor (Pillow is blocking)
-        try:
-            result = await self.hass.async_add_executor_job(
-                compute_bounding_boxes, image_bytes
-            )
-        except Exception:
-            _LOGGER.exception("Error processing pick image")
+        async with self._process_lock:
+            result = await self._async_analyze_image(image_bytes)
+        if result is None:
             return
 
         bboxes = result["bboxes"]
@@ -311,20 +707,10 @@ class BambuPlateAnalyzerSensor(SensorEntity):
 
         self._object_count = len(merged)
         self._objects = merged
+        self._bbox_data_str = serialize_bbox_data(merged)
         self._image_width = result["image_width"]
         self._image_height = result["image_height"]
 
-        # Convert pick image to JPEG and store for the image entity
-        try:
-            jpeg_bytes = await self.hass.async_add_executor_job(
-                convert_to_jpeg, image_bytes
-            )
-            entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-            entry_data["jpeg_bytes"] = jpeg_bytes
-            entry_data["jpeg_updated"] = datetime.now(timezone.utc)
-        except Exception:
-            _LOGGER.exception("Error converting pick image to JPEG")
-
         _LOGGER.debug(
             "Plate analysis complete: %d objects, image %dx%d",
             self._object_count,